@@ -1,27 +1,13 @@
-from ultralytics import YOLO
-import cv2
-import time
+import os
+import sys
 
-# cap = cv2.VideoCapture("Videos/people.mp4")
-cap = cv2.VideoCapture(0)
-model = YOLO("yolo11n.pt")
+# get_model y run_webcam viven en 2_Ejemplos/
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(script_dir, "..", "2_Ejemplos"))
 
-while cap.isOpened():
-    success, frame = cap.read()
-    if not success:
-        break
+from utils_yolo import get_model  # noqa: E402
+from yolo_webcam import run_webcam  # noqa: E402
 
-    results = model(frame)
-    annotated_frame = results[0].plot()
-
-    cv2.imshow("frame", frame)
-    cv2.imshow("frame", annotated_frame)
-
-    if cv2.waitKey(1) & 0xFF == ord("q"):
-        break
-
-cap.release()
-cv2.destroyAllWindows()
-for _ in range(5):
-    cv2.waitKey(1)
-time.sleep(1)
+model = get_model("yolo11n")  # TensorRT/OpenVINO, exportado una sola vez
+# run_webcam(model, cam="Videos/people.mp4")
+run_webcam(model, cam=0)
@@ -1,5 +1,5 @@
-from ultralytics import YOLO
+from utils_yolo import get_model
 
-model = YOLO("yolo11n.pt")  # initialize model
+model = get_model("yolo11n")  # initialize model
 results = model("https://ultralytics.com/images/bus.jpg")  # perform inference
 results[0].show()  # display results for the first image
@@ -1,32 +1,40 @@
 import matplotlib.pyplot as plt
-from ultralytics import YOLO
-
-# Load a model
-model = YOLO("yolo11n.pt")  # load an official model
-# model = YOLO("path/to/best.pt")  # load a custom model
-
-# Predict with the model
-results = model("https://ultralytics.com/images/bus.jpg")  # predict on an image
-
-# Access the results
-for result in results:
-    xywh = result.boxes.xywh  # center-x, center-y, width, height
-    xywhn = result.boxes.xywhn  # normalized
-    xyxy = result.boxes.xyxy  # top-left-x, top-left-y, bottom-right-x, bottom-right-y
-    xyxyn = result.boxes.xyxyn  # normalized
-    names = [
-        result.names[cls.item()] for cls in result.boxes.cls.int()
-    ]  # class name of each box
-    confs = result.boxes.conf  # confidence score of each box
-    print("xywh:", xywh)
-    print("xywhn:", xywhn)
-    print("xyxy:", xyxy)
-    print("xyxyn:", xyxyn)
-    print("names:", names)
-    print("confs:", confs)
-
-show = result.plot()  # return annotated image (np.array)
-
-plt.imshow(show[:, :, ::-1])  # convert BGR to RGB
-plt.axis("off")
-plt.show()
+from utils_yolo import BATCH_MAX, HALF, get_model
+
+
+def demo(images: list[str]):
+    # Load an official model (TensorRT/OpenVINO)
+    model = get_model("yolo11n")
+    # model = YOLO("path/to/best.pt")  # load a custom model
+
+    # Predict with the model
+    # la lista se procesa en lotes (B x 3 x H x W) de hasta BATCH_MAX imágenes
+    results = model(images, imgsz=640, half=HALF, batch=min(len(images), BATCH_MAX))
+
+    # Access the results
+    for result in results:
+        xywh = result.boxes.xywh  # center-x, center-y, width, height
+        xywhn = result.boxes.xywhn  # normalized
+        xyxy = result.boxes.xyxy  # top-left-x, top-left-y, bottom-right-x, bottom-right-y
+        xyxyn = result.boxes.xyxyn  # normalized
+        names = [
+            result.names[cls.item()] for cls in result.boxes.cls.int()
+        ]  # class name of each box
+        confs = result.boxes.conf  # confidence score of each box
+        print("xywh:", xywh)
+        print("xywhn:", xywhn)
+        print("xyxy:", xyxy)
+        print("xyxyn:", xyxyn)
+        print("names:", names)
+        print("confs:", confs)
+
+        show = result.plot()  # return annotated image (np.array)
+
+        plt.imshow(show[:, :, ::-1])  # convert BGR to RGB
+        plt.axis("off")
+        plt.show()
+
+
+urls = ["https://ultralytics.com/images/bus.jpg"]
+# urls = urls * 4  # varias imágenes en una sola llamada
+demo(urls)
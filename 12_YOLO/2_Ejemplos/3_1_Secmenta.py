@@ -1,22 +1,29 @@
 import matplotlib.pyplot as plt
-from ultralytics import YOLO
+from utils_yolo import BATCH_MAX, HALF, get_model
 
-# Load a model
-model = YOLO("yolo11n-seg.pt")  # load an official model
-# model = YOLO("path/to/best.pt")  # load a custom model
 
-# Predict with the model
-results = model("https://ultralytics.com/images/bus.jpg")  # predict on an image
+def demo(images: list[str]):
+    # Load an official model (TensorRT/OpenVINO)
+    model = get_model("yolo11n-seg")
+    # model = YOLO("path/to/best.pt")  # load a custom model
 
-# Access the results
-for result in results:
-    xy = result.masks.xy  # mask in polygon format
-    xyn = result.masks.xyn  # normalized
-    masks = result.masks.data  # mask in matrix format (num_objects x H x W)
+    # Predict with the model
+    # la lista se procesa en lotes (B x 3 x H x W) de hasta BATCH_MAX imágenes
+    results = model(images, imgsz=640, half=HALF, batch=min(len(images), BATCH_MAX))
 
+    # Access the results
+    for result in results:
+        xy = result.masks.xy  # mask in polygon format
+        xyn = result.masks.xyn  # normalized
+        masks = result.masks.data  # mask in matrix format (num_objects x H x W)
 
-show = result.plot()  # return annotated image (np.array)
-# muestra la imagen
-plt.imshow(show[:, :, ::-1])  # convert BGR to RGB
-plt.axis("off")
-plt.show()
+        show = result.plot()  # return annotated image (np.array)
+        # muestra la imagen
+        plt.imshow(show[:, :, ::-1])  # convert BGR to RGB
+        plt.axis("off")
+        plt.show()
+
+
+urls = ["https://ultralytics.com/images/bus.jpg"]
+# urls = urls * 4  # varias imágenes en una sola llamada
+demo(urls)
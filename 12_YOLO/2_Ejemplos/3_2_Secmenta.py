@@ -1,10 +1,9 @@
 import matplotlib.pyplot as plt
-from ultralytics import YOLO
-import numpy as np
-import cv2
+from utils_yolo import get_model
+from ultralytics.utils.ops import scale_masks
 
 # Load a model
-model = YOLO("yolo11n-seg.pt")  # load an official model
+model = get_model("yolo11n-seg")  # load an official model (TensorRT/OpenVINO)
 # model = YOLO("path/to/best.pt")  # load a custom model
 
 # Predict with the model
@@ -27,24 +26,16 @@ for result in results:
     # print("confs:", confs) # tensor([0.8985, 0.8849, 0.8628, 0.8223, 0.4611, 0.4428])
     # print("classes:", classes) # tensor([ 5.,  0.,  0.,  0., 11.,  0.])
 
-    for i in range(len(masks)):
-        conf = float(confs[i].item())
-        cls = float(classes[i].item())
-
-        if cls == 0 and conf >= 0.8:
-            mask = masks[i]
-            if hasattr(mask, "cpu"):
-                mask = mask.cpu().numpy()
-            # ensure mask is binary (0/1) and resize to match original image size
-            mask = mask.astype(np.uint8)
-            # resize expects (width, height)
-            mask_resized = cv2.resize(
-                mask, (img.shape[1], img.shape[0]), interpolation=cv2.INTER_NEAREST
-            )
-            mask_bool = mask_resized.astype(bool)
-            # aplicar máscara a las 3 canales (BGR)
-            img[mask_bool] = 0
-            img[mask] = 0
+    # unir en el dispositivo las máscaras de personas con confianza >= 0.8
+    sel = (classes == 0) & (confs >= 0.8)
+    if sel.any():
+        m = masks[sel].any(0, keepdim=True)[None]  # (1, 1, H, W)
+        # quitar el relleno del letterbox y escalar una sola vez al tamaño original
+        m = scale_masks(m.float(), img.shape[:2])
+        mask_bool = (m[0, 0] > 0.5).cpu().numpy()
+        # aplicar máscara a las 3 canales (BGR)
+        img[mask_bool] = 0
+
 
 # usar la imagen modificada para mostrar
 show = img
@@ -1,9 +1,9 @@
 import cv2
 import matplotlib.pyplot as plt
-from ultralytics import YOLO
+from utils_yolo import get_model
 
 # Load a model
-model = YOLO("yolo11n-pose.pt")  # load an official model
+model = get_model("yolo11n-pose")  # load an official model (TensorRT/OpenVINO)
 # model = YOLO("path/to/best.pt")  # load a custom model
 
 # Predict with the model
@@ -1,25 +1,6 @@
-import cv2
-import matplotlib.pyplot as plt
-from ultralytics import YOLO
+from utils_yolo import get_model
+from yolo_webcam import run_webcam
 
-# Load a model
-model = YOLO("yolo11n-pose.pt")  # load an official model
-cap = cv2.VideoCapture(0)
-
-
-while cap.isOpened():
-    success, frame = cap.read()
-    if not success:
-        break
-
-    results = model(frame)
-    annotated_frame = results[0].plot()
-
-    cv2.imshow("frame", frame)
-    cv2.imshow("frame", annotated_frame)
-
-    if cv2.waitKey(1) & 0xFF == ord("q"):
-        break
-
-cap.release()
-cv2.destroyAllWindows()
+# Load an official model (TensorRT/OpenVINO)
+model = get_model("yolo11n-pose")
+run_webcam(model)
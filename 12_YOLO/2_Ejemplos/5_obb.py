@@ -1,26 +1,33 @@
 import cv2
 import matplotlib.pyplot as plt
-from ultralytics import YOLO
+from utils_yolo import BATCH_MAX, HALF, get_model
 
-# Load a model
-model = YOLO("yolo11n-obb.pt")  # load an official model
-# model = YOLO("path/to/best.pt")  # load a custom model
 
-# Predict with the model
-results = model("https://ultralytics.com/images/boats.jpg")  # predict on an image
+def demo(images: list[str]):
+    # Load an official model (TensorRT/OpenVINO)
+    model = get_model("yolo11n-obb")
+    # model = YOLO("path/to/best.pt")  # load a custom model
 
-# Access the results
-for result in results:
-    xywhr = result.obb.xywhr  # center-x, center-y, width, height, angle (radians)
-    xyxyxyxy = result.obb.xyxyxyxy  # polygon format with 4-points
-    names = [
-        result.names[cls.item()] for cls in result.obb.cls.int()
-    ]  # class name of each box
-    confs = result.obb.conf  # confidence score of each box
+    # Predict with the model
+    # la lista se procesa en lotes (B x 3 x H x W) de hasta BATCH_MAX imágenes
+    results = model(images, imgsz=640, half=HALF, batch=min(len(images), BATCH_MAX))
 
+    # Access the results
+    for result in results:
+        xywhr = result.obb.xywhr  # center-x, center-y, width, height, angle (radians)
+        xyxyxyxy = result.obb.xyxyxyxy  # polygon format with 4-points
+        names = [
+            result.names[cls.item()] for cls in result.obb.cls.int()
+        ]  # class name of each box
+        confs = result.obb.conf  # confidence score of each box
 
-show = result.plot()  # return annotated image (np.array)
-# muestra la imagen
-plt.imshow(show[:, :, ::-1])
-plt.axis("off")
-plt.show()
+        show = result.plot()  # return annotated image (np.array)
+        # muestra la imagen
+        plt.imshow(show[:, :, ::-1])
+        plt.axis("off")
+        plt.show()
+
+
+urls = ["https://ultralytics.com/images/boats.jpg"]
+# urls = urls * 4  # varias imágenes en una sola llamada
+demo(urls)
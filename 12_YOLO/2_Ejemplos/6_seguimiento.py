@@ -3,39 +3,35 @@ import os
 
 os.environ["KMP_DUPLICATE_LIB_OK"] = "TRUE"
 
-from ultralytics import YOLO
+from utils_yolo import HALF, get_model
 
 # Load the YOLO11 model
-model = YOLO("yolo11n.pt")
+model = get_model("yolo11n")
 
 # Open the video file
 # results = model.track("https://youtu.be/LNwODJXcvt4", show=True, tracker="bytetrack.yaml")  # with ByteTrack
 cwd = os.getcwd()
 new_path = os.path.join(cwd, "12_YOLO", "1_Intro", "Videos", "people.mp4")
-cap = cv2.VideoCapture(new_path)
 
-# Loop through the video frames
-while cap.isOpened():
-    # Read a frame from the video
-    success, frame = cap.read()
-
-    if success:
-        # Run YOLO11 tracking on the frame, persisting tracks between frames
-        results = model.track(frame, persist=True)
-
-        # Visualize the results on the frame
-        annotated_frame = results[0].plot()
-
-        # Display the annotated frame
-        cv2.imshow("YOLO11 Tracking", annotated_frame)
-
-        # Break the loop if 'q' is pressed
-        if cv2.waitKey(1) & 0xFF == ord("q"):
-            break
-    else:
-        # Break the loop if the end of the video is reached
+# Ultralytics decodes the video and runs the tracker in its own streaming loop
+for result in model.track(
+    source=new_path,
+    persist=True,
+    stream=True,
+    tracker="bytetrack.yaml",
+    imgsz=640,
+    half=HALF,
+    verbose=False,
+):
+    # Visualize the results on the frame
+    annotated_frame = result.plot()
+
+    # Display the annotated frame
+    cv2.imshow("YOLO11 Tracking", annotated_frame)
+
+    # Break the loop if 'q' is pressed
+    if cv2.waitKey(1) & 0xFF == ord("q"):
         break
 
-# Release the video capture object and close the display window
-cap.release()
+# Close the display window
 cv2.destroyAllWindows()
@@ -0,0 +1,59 @@
+import os
+
+import torch
+from ultralytics import YOLO
+from ultralytics.cfg import TASK2DATA
+
+# FP16 solo con GPU; el modelo OpenVINO INT8 de CPU recibe entrada FP32
+HALF = torch.cuda.is_available()
+
+# lote máximo de las exportaciones dinámicas; listas más largas se parten en lotes
+BATCH_MAX = 8
+
+# modelos ya cargados en este proceso, por archivo exportado
+_MODEL_CACHE: dict[str, YOLO] = {}
+
+
+def get_model(name):
+    """
+    Carga el modelo `name` (por ejemplo "yolo11n-pose") ya exportado.
+
+    Con GPU usa TensorRT FP16 (.engine); sin GPU usa OpenVINO INT8
+    ({name}_int8_openvino_model/).
+    La exportación se hace solo la primera vez y el archivo queda junto al .pt;
+    dentro del mismo proceso (REPL, notebook) el modelo se carga una sola vez.
+    La exportación es dinámica, así que el mismo archivo sirve para cualquier
+    lote de hasta BATCH_MAX imágenes.
+    """
+    name = name.removesuffix(".pt")
+
+    if torch.cuda.is_available():
+        path = f"{name}.engine"
+        if not os.path.exists(path):
+            path = YOLO(f"{name}.pt").export(
+                format="engine",
+                half=True,
+                imgsz=640,
+                batch=BATCH_MAX,
+                dynamic=True,
+                workspace=4,
+            )
+    else:
+        path = f"{name}_int8_openvino_model"
+        if not os.path.exists(path):
+            model = YOLO(f"{name}.pt")
+            # calibración INT8 con el dataset pequeño de la tarea (coco8, coco8-pose, ...)
+            path = model.export(
+                format="openvino",
+                int8=True,
+                imgsz=640,
+                batch=BATCH_MAX,
+                dynamic=True,
+                data=TASK2DATA[model.task],
+            )
+
+    # export() puede devolver la ruta absoluta o con "/" final
+    path = os.path.abspath(path)
+    if path not in _MODEL_CACHE:
+        _MODEL_CACHE[path] = YOLO(path)
+    return _MODEL_CACHE[path]
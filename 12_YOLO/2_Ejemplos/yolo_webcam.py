@@ -0,0 +1,100 @@
+import cv2
+import numpy as np
+import queue
+import threading
+import torch
+from ultralytics import YOLO
+
+
+def run_webcam(model: YOLO, cam=0, imgsz=640):
+    """
+    Muestra en vivo las predicciones de `model` sobre la cámara `cam`.
+
+    La inferencia corre en un hilo aparte sobre el frame más reciente; la
+    captura y la ventana siguen en el hilo principal. Salir con 'q'.
+    """
+    device = 0 if torch.cuda.is_available() else "cpu"
+    half = torch.cuda.is_available()
+
+    cap = cv2.VideoCapture(cam)
+    # capturar directamente al tamaño de inferencia evita un resize en YOLO
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, imgsz)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, imgsz)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # no acumular frames viejos
+
+    # Warmup con la forma fija de entrada: la carga del engine y la reserva de
+    # memoria ocurren aquí y no en el primer frame de la cámara
+    model.predict(
+        np.zeros((imgsz, imgsz, 3), np.uint8),
+        half=half,
+        imgsz=imgsz,
+        device=device,
+        verbose=False,
+    )
+
+    # La cola solo guarda el frame más reciente
+    frames = queue.Queue(maxsize=1)
+    latest = {"result": None, "error": None}
+    lock = threading.Lock()
+    running = threading.Event()
+    running.set()
+
+    def inferencia():
+        while running.is_set():
+            try:
+                frame = frames.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            try:
+                results = model.predict(
+                    frame, half=half, imgsz=imgsz, device=device, verbose=False
+                )
+            except Exception as e:
+                # se guarda para relanzarlo en el hilo principal
+                latest["error"] = e
+                running.clear()
+                return
+            with lock:
+                latest["result"] = results[0]
+
+    worker = threading.Thread(target=inferencia, daemon=True)
+    worker.start()
+
+    shown_result = None
+    annotated_frame = None
+
+    while cap.isOpened() and running.is_set():
+        if not cap.grab():
+            break
+        success, frame = cap.retrieve()
+        if not success:
+            break
+
+        # descarta el frame pendiente si la inferencia va atrasada
+        try:
+            frames.get_nowait()
+        except queue.Empty:
+            pass
+        frames.put_nowait(frame)
+
+        with lock:
+            result = latest["result"]
+        # solo se dibuja cuando hay un resultado nuevo
+        if result is not shown_result:
+            annotated_frame = result.plot()
+            shown_result = result
+
+        cv2.imshow("frame", annotated_frame if annotated_frame is not None else frame)
+
+        if cv2.waitKey(1) & 0xFF == ord("q"):
+            break
+
+    running.clear()
+    worker.join()
+    cap.release()
+    cv2.destroyAllWindows()
+    for _ in range(5):
+        cv2.waitKey(1)
+
+    if latest["error"] is not None:
+        raise latest["error"]